@@ -17,87 +17,172 @@ CSV Structure:
 Output: data/hk2020-growth-data.json (new nested structure)
 """
 
-import csv
+import argparse
 import json
 import os
+import sys
+from functools import lru_cache
+from math import isfinite
+from operator import itemgetter
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the standard json module
+    orjson = None
 
-def extract_hk_growth_data(csv_file_path='../reference/HK-2020-StandardTables_v2.csv'):
+
+# Default input and output locations, resolved from this script's directory
+# so the script works from the repository root as well as from scripts/
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CSV_FILE_PATH = os.path.join(PROJECT_DIR, 'reference', 'HK-2020-StandardTables_v2.csv')
+OUTPUT_PATH = os.path.join(PROJECT_DIR, 'data', 'hk2020-growth-data.json')
+
+# Percentile keys in the order they appear in the CSV and in the output
+PERCENTILE_KEYS = ('p0_4', 'p2', 'p9', 'p25', 'p50', 'p75', 'p91', 'p98', 'p99_6')
+
+# CSV column indices (see module docstring)
+AGE_COLUMN = 0
+GIRLS_COLUMNS = range(5, 14)
+BOYS_COLUMNS = range(17, 26)
+
+# Pick the eighteen percentile cells (girls then boys) out of a CSV row in one call
+_select_percentile_cells = itemgetter(*GIRLS_COLUMNS, *BOYS_COLUMNS)
+
+
+def _parse_row(row):
     """
-    Extract Hong Kong 2020 growth chart data from CSV file.
+    Convert one CSV row into its age and percentile values.
     
     Args:
-        csv_file_path (str): Path to the CSV file
+        row (list): Cells of one CSV line, split on commas
         
     Returns:
-        dict: Structured growth data for boys and girls in new nested format
+        tuple: (age in months, nine girls heights, nine boys heights), or
+        None if the row is a header, blank, truncated or has a cell that is
+        not a finite number (float() also accepts "nan" and "inf", which
+        JSON cannot represent), so that such rows are skipped like dropna()
+        would
     """
     
-    # Initialize data structure to match the new application format
-    boys_ages = []
-    boys_percentiles = {
-        'p0_4': [],   # 0.4th percentile
-        'p2': [],     # 2nd percentile
-        'p9': [],     # 9th percentile
-        'p25': [],    # 25th percentile
-        'p50': [],    # 50th percentile (median)
-        'p75': [],    # 75th percentile
-        'p91': [],    # 91st percentile
-        'p98': [],    # 98th percentile
-        'p99_6': []   # 99.6th percentile
-    }
+    if len(row) <= BOYS_COLUMNS[-1]:
+        return None
+    
+    # Ages are whole months, possibly written with a trailing ".0", so the
+    # integer part is parsed directly instead of going through float()
+    whole, _, fraction = row[AGE_COLUMN].strip().partition(b'.')
+    if not whole.isdigit() or (fraction and not fraction.isdigit()):
+        return None
+    
+    try:
+        heights = tuple(map(float, _select_percentile_cells(row)))
+    except ValueError:
+        return None
+    
+    if not all(map(isfinite, heights)):
+        return None
+    
+    return (int(whole), *heights)
+
+
+def _parse_columns(buf):
+    """
+    Split raw CSV bytes into data columns.
+    
+    The file is plain ASCII with no quoted fields, so lines are split on
+    commas directly rather than through the csv module. Cells are kept as
+    bytes, which float() and int() accept as-is, so the buffer is never
+    decoded. Header rows, blank or truncated rows and rows with any
+    non-numeric or non-finite age or percentile cell are skipped as a whole, so the
+    columns always stay aligned by age.
+    
+    Args:
+        buf (bytes): Contents of the CSV file
+        
+    Returns:
+        list: One tuple per column: the ages in months, then the nine girls
+        and the nine boys percentile columns as floats, in PERCENTILE_KEYS
+        order; an empty list if the buffer holds no data rows
+    """
+    
+    rows = [row for row in map(_parse_row, (line.split(b',') for line in buf.splitlines())) if row]
+    return list(zip(*rows))
+
+
+@lru_cache(maxsize=8)
+def _parse_csv_file(csv_file_path, mtime_ns, size):
+    """
+    Read and convert the CSV, memoized on the file's path, mtime and size.
+    
+    The modification time and size are only part of the cache key, so that
+    an edited file is parsed again while repeated calls on an unchanged file
+    (e.g. several imports in one test session) reuse the first result.
+    
+    Args:
+        csv_file_path (str): Resolved (realpath) path to the CSV file, so a
+            relative path cannot name a different file after a chdir
+        mtime_ns (int): Modification time of the file in nanoseconds
+        size (int): Size of the file in bytes
+        
+    Returns:
+        tuple: (ages, boys, girls) where ages is a tuple of months and boys
+        and girls each hold one tuple of heights per percentile, in
+        PERCENTILE_KEYS order; None if the file holds no data rows
+    """
+    
+    # The whole file is read in one call sized from fstat, so no read
+    # buffer is needed; bytes.splitlines() copes with LF and CRLF alike
+    with open(csv_file_path, 'rb', buffering=0) as f:
+        columns = _parse_columns(f.read())
+    
+    if not columns:
+        return None
+    
+    ages = columns[AGE_COLUMN]
+    girls = tuple(columns[1:1 + len(GIRLS_COLUMNS)])
+    boys = tuple(columns[1 + len(GIRLS_COLUMNS):])
+    
+    return ages, boys, girls
+
+
+def _build_gender_data(age_months, percentiles):
+    """
+    Build the nested growth data for one gender.
     
-    girls_ages = []
-    girls_percentiles = {
-        'p0_4': [],   # 0.4th percentile
-        'p2': [],     # 2nd percentile
-        'p9': [],     # 9th percentile
-        'p25': [],    # 25th percentile
-        'p50': [],    # 50th percentile (median)
-        'p75': [],    # 75th percentile
-        'p91': [],    # 91st percentile
-        'p98': [],    # 98th percentile
-        'p99_6': []   # 99.6th percentile
+    Args:
+        age_months (tuple): Ages in months, one per row
+        percentiles (tuple): One tuple of heights per percentile, in
+            PERCENTILE_KEYS order
+        
+    Returns:
+        dict: {'ages': [...], 'percentiles': {'p0_4': [...], ...}}
+    """
+    
+    return {
+        'ages': list(age_months),
+        'percentiles': dict(zip(PERCENTILE_KEYS, map(list, percentiles)))
     }
+
+
+def extract_hk_growth_data(csv_file_path=CSV_FILE_PATH):
+    """
+    Extract Hong Kong 2020 growth chart data from CSV file.
+    
+    Parsing is memoized on the file's path, modification time and size, so
+    repeated calls on an unchanged file skip the parse; each call still
+    returns freshly built lists that the caller is free to modify.
+    
+    Args:
+        csv_file_path (str): Path to the CSV file
+        
+    Returns:
+        dict: Structured growth data for boys and girls in new nested format
+    """
     
     try:
-        with open(csv_file_path, 'r') as f:
-            reader = csv.reader(f)
-            next(reader)  # Skip first header row
-            next(reader)  # Skip second header row
-            
-            for row in reader:
-                try:
-                    age_months = int(float(row[0]))
-                    
-                    # Girls data: columns 5-13
-                    girls_ages.append(age_months)
-                    girls_percentiles['p0_4'].append(float(row[5]))   # Girls cent0.4
-                    girls_percentiles['p2'].append(float(row[6]))     # Girls cent2
-                    girls_percentiles['p9'].append(float(row[7]))     # Girls cent9
-                    girls_percentiles['p25'].append(float(row[8]))    # Girls cent25
-                    girls_percentiles['p50'].append(float(row[9]))    # Girls cent50
-                    girls_percentiles['p75'].append(float(row[10]))   # Girls cent75
-                    girls_percentiles['p91'].append(float(row[11]))   # Girls cent91
-                    girls_percentiles['p98'].append(float(row[12]))   # Girls cent98
-                    girls_percentiles['p99_6'].append(float(row[13])) # Girls cent99.6
-                    
-                    # Boys data: columns 17-25
-                    boys_ages.append(age_months)
-                    boys_percentiles['p0_4'].append(float(row[17]))   # Boys cent0.4
-                    boys_percentiles['p2'].append(float(row[18]))     # Boys cent2
-                    boys_percentiles['p9'].append(float(row[19]))     # Boys cent9
-                    boys_percentiles['p25'].append(float(row[20]))    # Boys cent25
-                    boys_percentiles['p50'].append(float(row[21]))    # Boys cent50
-                    boys_percentiles['p75'].append(float(row[22]))    # Boys cent75
-                    boys_percentiles['p91'].append(float(row[23]))    # Boys cent91
-                    boys_percentiles['p98'].append(float(row[24]))    # Boys cent98
-                    boys_percentiles['p99_6'].append(float(row[25]))  # Boys cent99.6
-                    
-                except (ValueError, IndexError):
-                    # Skip rows with invalid data
-                    continue
-                    
+        real_path = os.path.realpath(csv_file_path)
+        st = os.stat(real_path)
+        parsed = _parse_csv_file(real_path, st.st_mtime_ns, st.st_size)
+        
     except FileNotFoundError:
         print(f"Error: CSV file not found at {csv_file_path}")
         return None
@@ -105,20 +190,20 @@ def extract_hk_growth_data(csv_file_path='../reference/HK-2020-StandardTables_v2
         print(f"Error reading CSV file: {e}")
         return None
     
+    if parsed is None:
+        print(f"Error: no data rows found in {csv_file_path}")
+        return None
+    
+    ages, boys, girls = parsed
+    
     # Return data in the new nested structure format
     return {
-        'boy': {
-            'ages': boys_ages,
-            'percentiles': boys_percentiles
-        },
-        'girl': {
-            'ages': girls_ages,
-            'percentiles': girls_percentiles
-        }
+        'boy': _build_gender_data(ages, boys),
+        'girl': _build_gender_data(ages, girls)
     }
 
 
-def save_data_file(data, output_path='../data/hk2020-growth-data.json'):
+def save_data_file(data, output_path=OUTPUT_PATH):
     """
     Save the extracted data to JSON file in the data directory.
     
@@ -139,8 +224,12 @@ def save_data_file(data, output_path='../data/hk2020-growth-data.json'):
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
         # Save to the data directory with compact format (same as current file)
-        with open(output_path, 'w') as f:
-            json.dump(data, f, separators=(',', ':'))
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(data))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(data, f, separators=(',', ':'), allow_nan=False)
         
         print(f"✅ Data saved to '{output_path}'")
         return True
@@ -150,6 +239,34 @@ def save_data_file(data, output_path='../data/hk2020-growth-data.json'):
         return False
 
 
+def is_data_file_up_to_date(csv_file_path=CSV_FILE_PATH, output_path=OUTPUT_PATH):
+    """
+    Check whether the data file is newer than both the CSV source and this script.
+    
+    The CSV is static reference data, so once it has been converted there is
+    no need to parse it again until either input changes.
+    
+    Args:
+        csv_file_path (str): Path to the CSV file
+        output_path (str): Path to the generated JSON file
+        
+    Returns:
+        bool: True if the data file can be reused as-is, False if it is
+        not strictly newer than either input or if any of the files is
+        missing
+    """
+    
+    try:
+        output_mtime = os.stat(output_path).st_mtime_ns
+        source_mtime = max(os.stat(csv_file_path).st_mtime_ns, os.stat(__file__).st_mtime_ns)
+    except OSError:
+        return False
+    
+    # Strictly newer: on filesystems with coarse timestamps an input edited
+    # in the same tick as the last save must still count as changed
+    return output_mtime > source_mtime
+
+
 def display_sample_data(data):
     """
     Display sample data for verification.
@@ -161,9 +278,12 @@ def display_sample_data(data):
     if not data:
         return
     
-    print("\n" + "=" * 60)
-    print("SAMPLE DATA VERIFICATION")
-    print("=" * 60)
+    lines = [
+        "",
+        "=" * 60,
+        "SAMPLE DATA VERIFICATION",
+        "=" * 60
+    ]
     
     for gender in ['boy', 'girl']:
         gender_data = data[gender]
@@ -171,24 +291,43 @@ def display_sample_data(data):
         age_range_months = (min(gender_data['ages']), max(gender_data['ages']))
         age_range_years = (age_range_months[0] / 12, age_range_months[1] / 12)
         
-        print(f"\n{gender.title()}s:")
-        print(f"  • Data points: {total_points}")
-        print(f"  • Age range: {age_range_months[0]} to {age_range_months[1]} months ({age_range_years[0]:.1f} to {age_range_years[1]:.1f} years)")
-        print(f"  • 50th percentile at 18 years: {gender_data['percentiles']['p50'][-1]} cm")
-        
-        # Show first few data points
-        print(f"  • First 3 ages: {gender_data['ages'][:3]} months")
-        print(f"  • First 3 heights (50th percentile): {gender_data['percentiles']['p50'][:3]} cm")
+        lines += [
+            f"\n{gender.title()}s:",
+            f"  • Data points: {total_points}",
+            f"  • Age range: {age_range_months[0]} to {age_range_months[1]} months ({age_range_years[0]:.1f} to {age_range_years[1]:.1f} years)",
+            f"  • 50th percentile at 18 years: {gender_data['percentiles']['p50'][-1]} cm",
+            # Show first few data points
+            f"  • First 3 ages: {gender_data['ages'][:3]} months",
+            f"  • First 3 heights (50th percentile): {gender_data['percentiles']['p50'][:3]} cm"
+        ]
+    
+    # Write the whole report at once rather than one print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
     """Main function to extract and save Hong Kong growth data."""
     
+    parser = argparse.ArgumentParser(description="Extract Hong Kong 2020 growth chart data from the CSV source.")
+    parser.add_argument('--force', action='store_true',
+                        help="regenerate the data file even if it is newer than the CSV source")
+    parser.add_argument('--verbose', action='store_true',
+                        help="print sample values from the extracted data for verification")
+    args = parser.parse_args()
+    
     print("🇭🇰 Hong Kong 2020 Growth Chart Data Extractor")
     print("=" * 60)
     print("Generating data for the new application architecture...")
     print()
     
+    up_to_date = not args.force and is_data_file_up_to_date()
+    
+    # --verbose still extracts and shows the sample data; only the save is skipped
+    if up_to_date and not args.verbose:
+        print(f"✅ {os.path.relpath(OUTPUT_PATH)} is already up to date with the CSV source.")
+        print("   Use --force to regenerate it anyway.")
+        return
+    
     # Extract data from CSV
     print("📊 Extracting data from CSV file...")
     data = extract_hk_growth_data()
@@ -200,7 +339,13 @@ def main():
     print("✅ Data extraction successful!")
     
     # Display sample data for verification
-    display_sample_data(data)
+    if args.verbose:
+        display_sample_data(data)
+    
+    if up_to_date:
+        print(f"\n✅ {os.path.relpath(OUTPUT_PATH)} is already up to date with the CSV source; not rewritten.")
+        print("   Use --force to regenerate it anyway.")
+        return
     
     # Save to the new location
     print(f"\n💾 Saving data to application directory...")
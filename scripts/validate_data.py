@@ -1,9 +1,20 @@
 #!/usr/bin/env python3
 import json
+import os
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the standard json module
+    orjson = None
+
+# Resolved from this script's directory so it works from the repository root
+# as well as from scripts/
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_PATH = os.path.join(PROJECT_DIR, 'data', 'hk2020-growth-data.json')
 
 # Load and validate the generated data
-with open('../data/hk2020-growth-data.json') as f:
-    data = json.load(f)
+with open(DATA_PATH, 'rb') as f:
+    data = orjson.loads(f.read()) if orjson is not None else json.load(f)
 
 print('✅ Data Structure Validation:')
 print(f"   • Boys ages: {len(data['boy']['ages'])} data points")